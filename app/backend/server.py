@@ -1,33 +1,82 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Response, status
+from fastapi import Path as PathParam
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from pymongo.write_concern import WriteConcern
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
 from typing import List, Optional
+import re
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
+import asyncio
 import bcrypt
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, InvalidHashError
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=50,
+    minPoolSize=10,
+    maxIdleTimeMS=300000,
+    serverSelectionTimeoutMS=2000,
+    waitQueueTimeoutMS=1000,
+    compressors="zlib"
+)
 db = client[os.environ['DB_NAME']]
 
+# Carts are cheap to lose and hot to write, so skip waiting on the journal;
+# users and orders keep the default (durable) write concern
+cart_collection = db.get_collection("cart", write_concern=WriteConcern(w=1, j=False))
+
 # JWT Configuration
 JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production')
 JWT_ALGORITHM = 'HS256'
+JWT_SIGNING_KEY = JWT_SECRET.encode('utf-8')
+JWT_DECODE_OPTIONS = {"require": ["exp", "user_id"], "verify_aud": False}
+jwt_codec = jwt.PyJWT()
 JWT_EXPIRATION_HOURS = 24
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+
+# Verified tokens -> (user_id, exp timestamp), least recently used first
+token_cache = OrderedDict()
+
+# Restaurant search falls back to substring regex matching when enabled
+SEARCH_USE_REGEX = os.environ.get('SEARCH_USE_REGEX', 'false').lower() == 'true'
+
+# In-process cache for the restaurant listing (mostly static seeded data)
+RESTAURANTS_CACHE_TTL_SECONDS = 30
+RESTAURANTS_CACHE_MAX_ENTRIES = 1024
+restaurants_cache = {}
+
+# Password hashing (Argon2id, tuned for interactive logins)
+password_hasher = PasswordHasher(time_cost=3, memory_cost=4096, parallelism=1)
+
+# Identifiers (seeded slugs and uuid4 strings) accepted from clients
+ID_PATTERN = r"^[A-Za-z0-9_-]+$"
+ID_MAX_LENGTH = 64
+
+# Attempts at the atomic add-to-cart sequence before giving up on contention
+CART_ADD_MAX_ATTEMPTS = 3
 
 # Create the main app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 security = HTTPBearer()
 
@@ -79,14 +128,17 @@ class CartItem(BaseModel):
     menu_item_id: str
     quantity: int
     restaurant_id: str
+    # Snapshot of the menu item taken when it was added to the cart
+    name: str
+    price: float
+    image: str
 
 class AddToCart(BaseModel):
-    menu_item_id: str
+    menu_item_id: str = Field(..., min_length=1, max_length=ID_MAX_LENGTH, pattern=ID_PATTERN)
     quantity: int = 1
-    restaurant_id: str
 
 class UpdateCartItem(BaseModel):
-    menu_item_id: str
+    menu_item_id: str = Field(..., min_length=1, max_length=ID_MAX_LENGTH, pattern=ID_PATTERN)
     quantity: int
 
 class Cart(BaseModel):
@@ -116,46 +168,105 @@ class Order(BaseModel):
     delivery_address: str
     created_at: str
 
+class OrderPage(BaseModel):
+    items: List[Order]
+    # created_at cursor for the next (older) page, or None on the last page
+    next_before: Optional[str] = None
+
 # ============ Helper Functions ============
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return password_hasher.hash(password)
 
 def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    # Accounts created before the Argon2 switch still carry bcrypt hashes
+    if hashed.startswith('$2'):
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    try:
+        return password_hasher.verify(hashed, password)
+    except (VerifyMismatchError, InvalidHashError):
+        return False
+
+def needs_rehash(hashed: str) -> bool:
+    return hashed.startswith('$2') or password_hasher.check_needs_rehash(hashed)
 
 def create_token(user_id: str) -> str:
     payload = {
         'user_id': user_id,
         'exp': datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
     }
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return jwt_codec.encode(payload, JWT_SIGNING_KEY, algorithm=JWT_ALGORITHM)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    token = credentials.credentials
+    cached = token_cache.get(token)
+    if cached and time.time() < cached[1]:
+        token_cache.move_to_end(token)
+        return cached[0]
+    
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = jwt_codec.decode(
+            token, JWT_SIGNING_KEY, algorithms=[JWT_ALGORITHM], options=JWT_DECODE_OPTIONS
+        )
         user_id = payload.get('user_id')
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
+        
+        token_cache[token] = (user_id, payload.get('exp', 0))
+        token_cache.move_to_end(token)
+        if len(token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+            token_cache.popitem(last=False)
         return user_id
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+class MenuItemLoader:
+    # Per-request batch loader: resolves menu items by id in one query and
+    # memoizes them for the rest of the request. Pass with_restaurant=True to
+    # also join in the restaurant name (only order creation needs it)
+    PROJECTION = {"_id": 0, "id": 1, "name": 1, "price": 1, "image": 1, "restaurant_id": 1}
+
+    def __init__(self):
+        self._cache = {False: {}, True: {}}
+
+    async def load_many(self, ids: List[str], with_restaurant: bool = False) -> dict:
+        cache = self._cache[with_restaurant]
+        missing = [i for i in dict.fromkeys(ids) if i not in cache]
+        if missing and with_restaurant:
+            pipeline = [
+                {"$match": {"id": {"$in": missing}}},
+                {"$lookup": {
+                    "from": "restaurants",
+                    "localField": "restaurant_id",
+                    "foreignField": "id",
+                    "as": "rest"
+                }},
+                {"$unwind": {"path": "$rest", "preserveNullAndEmptyArrays": True}},
+                {"$project": {**self.PROJECTION, "restaurant_name": "$rest.name"}}
+            ]
+            rows = await db.menu_items.aggregate(pipeline).to_list(len(missing))
+            cache.update({row["id"]: row for row in rows})
+        elif missing:
+            rows = await db.menu_items.find(
+                {"id": {"$in": missing}}, self.PROJECTION
+            ).to_list(len(missing))
+            cache.update({row["id"]: row for row in rows})
+        return {i: cache[i] for i in ids if i in cache}
+
 # ============ Auth Routes ============
 
 @api_router.post("/auth/register")
 async def register(user_data: UserRegister):
     # Check if user exists
-    existing_user = await db.users.find_one({"email": user_data.email})
+    existing_user = await db.users.find_one({"email": user_data.email}, {"_id": 0, "id": 1})
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create user
     user_id = str(uuid.uuid4())
-    hashed_pwd = hash_password(user_data.password)
+    hashed_pwd = await asyncio.to_thread(hash_password, user_data.password)
     
     user_doc = {
         "id": user_id,
@@ -169,7 +280,7 @@ async def register(user_data: UserRegister):
     
     await db.users.insert_one(user_doc)
     
-    token = create_token(user_id)
+    token = await asyncio.to_thread(create_token, user_id)
     
     return {
         "token": token,
@@ -185,15 +296,23 @@ async def register(user_data: UserRegister):
 @api_router.post("/auth/login")
 async def login(credentials: UserLogin):
     # Find user
-    user = await db.users.find_one({"email": credentials.email})
+    user = await db.users.find_one(
+        {"email": credentials.email},
+        {"_id": 0, "id": 1, "email": 1, "password": 1, "name": 1, "phone": 1, "address": 1}
+    )
     if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     # Verify password
-    if not verify_password(credentials.password, user['password']):
+    if not await asyncio.to_thread(verify_password, credentials.password, user['password']):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
-    token = create_token(user['id'])
+    # Upgrade legacy bcrypt hashes now that we have the plaintext
+    if needs_rehash(user['password']):
+        hashed_pwd = await asyncio.to_thread(hash_password, credentials.password)
+        await db.users.update_one({"id": user['id']}, {"$set": {"password": hashed_pwd}})
+    
+    token = await asyncio.to_thread(create_token, user['id'])
     
     return {
         "token": token,
@@ -215,22 +334,46 @@ async def get_me(user_id: str = Depends(get_current_user)):
 
 # ============ Restaurant Routes ============
 
-@api_router.get("/restaurants", response_model=List[Restaurant])
-async def get_restaurants(search: Optional[str] = None, cuisine: Optional[str] = None):
+@api_router.get("/restaurants", responses={200: {"model": List[Restaurant]}})
+async def get_restaurants(
+    search: Optional[str] = None,
+    cuisine: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0)
+):
+    cache_key = (search, cuisine, limit, offset)
+    cached = restaurants_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return Response(content=cached[1], media_type="application/json")
+    
     query = {}
-    if search:
+    sort = None
+    if search and SEARCH_USE_REGEX:
+        pattern = re.escape(search)
         query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}}
+            {"name": {"$regex": pattern, "$options": "i"}},
+            {"description": {"$regex": pattern, "$options": "i"}}
         ]
+    elif search:
+        query["$text"] = {"$search": search}
+        sort = [("score", {"$meta": "textScore"}), ("id", 1)]
     if cuisine:
         query["cuisine_type"] = cuisine
     
-    restaurants = await db.restaurants.find(query, {"_id": 0}).to_list(1000)
-    return restaurants
+    # A stable order (id breaks ties) keeps skip/limit pages from overlapping
+    cursor = db.restaurants.find(query, {"_id": 0}).sort(sort or [("id", 1)])
+    restaurants = await cursor.skip(offset).limit(limit).to_list(limit)
+    
+    if len(restaurants_cache) >= RESTAURANTS_CACHE_MAX_ENTRIES:
+        restaurants_cache.clear()
+    response = ORJSONResponse(restaurants)
+    restaurants_cache[cache_key] = (time.monotonic() + RESTAURANTS_CACHE_TTL_SECONDS, response.body)
+    return response
 
 @api_router.get("/restaurants/{restaurant_id}", response_model=Restaurant)
-async def get_restaurant(restaurant_id: str):
+async def get_restaurant(
+    restaurant_id: str = PathParam(..., min_length=1, max_length=ID_MAX_LENGTH, pattern=ID_PATTERN)
+):
     restaurant = await db.restaurants.find_one({"id": restaurant_id}, {"_id": 0})
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
@@ -238,105 +381,122 @@ async def get_restaurant(restaurant_id: str):
 
 # ============ Menu Routes ============
 
-@api_router.get("/restaurants/{restaurant_id}/menu", response_model=List[MenuItem])
-async def get_menu(restaurant_id: str, category: Optional[str] = None):
+@api_router.get("/restaurants/{restaurant_id}/menu", responses={200: {"model": List[MenuItem]}})
+async def get_menu(
+    restaurant_id: str = PathParam(..., min_length=1, max_length=ID_MAX_LENGTH, pattern=ID_PATTERN),
+    category: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=50),
+    offset: int = Query(0, ge=0)
+):
     query = {"restaurant_id": restaurant_id}
     if category:
         query["category"] = category
     
-    menu_items = await db.menu_items.find(query, {"_id": 0}).to_list(1000)
-    return menu_items
+    menu_items = await db.menu_items.find(query, {"_id": 0}).sort("id", 1).skip(offset).limit(limit).to_list(limit)
+    return ORJSONResponse(menu_items)
 
 # ============ Cart Routes ============
 
-@api_router.get("/cart")
-async def get_cart(user_id: str = Depends(get_current_user)):
-    cart = await db.cart.find_one({"user_id": user_id}, {"_id": 0})
+@api_router.get("/cart", response_model=Cart)
+async def get_cart(
+    user_id: str = Depends(get_current_user),
+    menu_loader: MenuItemLoader = Depends(MenuItemLoader)
+):
+    cart = await cart_collection.find_one({"user_id": user_id}, {"_id": 0, "user_id": 1, "items": 1})
     if not cart:
         return {"user_id": user_id, "items": []}
     
-    # Enrich cart items with full details
-    enriched_items = []
-    for item in cart.get("items", []):
-        menu_item = await db.menu_items.find_one({"id": item["menu_item_id"]}, {"_id": 0})
-        if menu_item:
-            enriched_items.append({
+    # Items store a snapshot of name/price/image; only carts written before
+    # that was introduced need enriching from menu_items
+    items = cart.get("items", [])
+    stale_ids = [item["menu_item_id"] for item in items if "price" not in item]
+    if stale_ids:
+        by_id = await menu_loader.load_many(stale_ids)
+        items = [
+            item if "price" in item else {
                 **item,
-                "name": menu_item["name"],
-                "price": menu_item["price"],
-                "image": menu_item["image"]
-            })
+                "name": by_id[item["menu_item_id"]]["name"],
+                "price": by_id[item["menu_item_id"]]["price"],
+                "image": by_id[item["menu_item_id"]]["image"]
+            }
+            for item in items
+            if "price" in item or item["menu_item_id"] in by_id
+        ]
     
-    return {"user_id": user_id, "items": enriched_items}
+    return {"user_id": user_id, "items": items}
 
 @api_router.post("/cart/add")
-async def add_to_cart(item: AddToCart, user_id: str = Depends(get_current_user)):
-    cart = await db.cart.find_one({"user_id": user_id})
-    
-    if not cart:
-        # Create new cart
-        cart = {
-            "user_id": user_id,
-            "items": [item.model_dump()]
-        }
-        await db.cart.insert_one(cart)
-    else:
-        # Check if item already in cart
-        items = cart.get("items", [])
-        found = False
-        for cart_item in items:
-            if cart_item["menu_item_id"] == item.menu_item_id:
-                cart_item["quantity"] += item.quantity
-                found = True
-                break
+async def add_to_cart(
+    item: AddToCart,
+    user_id: str = Depends(get_current_user),
+    menu_loader: MenuItemLoader = Depends(MenuItemLoader)
+):
+    # Every step is a single atomic update; retry if a concurrent request
+    # changes the cart between them
+    for _ in range(CART_ADD_MAX_ATTEMPTS):
+        # Bump the quantity in place if the item is already in the cart
+        result = await cart_collection.update_one(
+            {"user_id": user_id, "items.menu_item_id": item.menu_item_id},
+            {"$inc": {"items.$.quantity": item.quantity}}
+        )
+        if result.matched_count:
+            return {"message": "Item added to cart"}
         
-        if not found:
-            items.append(item.model_dump())
+        # Otherwise append it with a snapshot of the menu item, creating the cart if needed
+        menu_item = (await menu_loader.load_many([item.menu_item_id])).get(item.menu_item_id)
+        if not menu_item:
+            raise HTTPException(status_code=404, detail="Menu item not found")
         
-        await db.cart.update_one(
-            {"user_id": user_id},
-            {"$set": {"items": items}}
-        )
+        cart_item = {
+            "menu_item_id": menu_item["id"],
+            "restaurant_id": menu_item["restaurant_id"],
+            "quantity": item.quantity,
+            "name": menu_item["name"],
+            "price": menu_item["price"],
+            "image": menu_item["image"]
+        }
+        push_filter = {"user_id": user_id, "items.menu_item_id": {"$ne": item.menu_item_id}}
+        try:
+            await cart_collection.update_one(push_filter, {"$push": {"items": cart_item}}, upsert=True)
+            return {"message": "Item added to cart"}
+        except DuplicateKeyError:
+            # The cart already exists (possibly just created concurrently); the
+            # $ne filter isn't an equality match, so the server won't retry the upsert
+            result = await cart_collection.update_one(push_filter, {"$push": {"items": cart_item}})
+            if result.matched_count:
+                return {"message": "Item added to cart"}
+        # The item was added concurrently; loop back and $inc it
     
-    return {"message": "Item added to cart"}
+    raise HTTPException(status_code=409, detail="Cart was modified concurrently, please retry")
 
 @api_router.put("/cart/update")
 async def update_cart_item(item: UpdateCartItem, user_id: str = Depends(get_current_user)):
-    cart = await db.cart.find_one({"user_id": user_id})
-    if not cart:
-        raise HTTPException(status_code=404, detail="Cart not found")
-    
-    items = cart.get("items", [])
-    for cart_item in items:
-        if cart_item["menu_item_id"] == item.menu_item_id:
-            cart_item["quantity"] = item.quantity
-            break
-    
-    await db.cart.update_one(
-        {"user_id": user_id},
-        {"$set": {"items": items}}
+    result = await cart_collection.update_one(
+        {"user_id": user_id, "items.menu_item_id": item.menu_item_id},
+        {"$set": {"items.$.quantity": item.quantity}}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Cart item not found")
     
     return {"message": "Cart updated"}
 
 @api_router.delete("/cart/remove/{menu_item_id}")
-async def remove_from_cart(menu_item_id: str, user_id: str = Depends(get_current_user)):
-    cart = await db.cart.find_one({"user_id": user_id})
-    if not cart:
-        raise HTTPException(status_code=404, detail="Cart not found")
-    
-    items = [item for item in cart.get("items", []) if item["menu_item_id"] != menu_item_id]
-    
-    await db.cart.update_one(
+async def remove_from_cart(
+    menu_item_id: str = PathParam(..., min_length=1, max_length=ID_MAX_LENGTH, pattern=ID_PATTERN),
+    user_id: str = Depends(get_current_user)
+):
+    result = await cart_collection.update_one(
         {"user_id": user_id},
-        {"$set": {"items": items}}
+        {"$pull": {"items": {"menu_item_id": menu_item_id}}}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Cart not found")
     
     return {"message": "Item removed from cart"}
 
 @api_router.delete("/cart/clear")
 async def clear_cart(user_id: str = Depends(get_current_user)):
-    await db.cart.update_one(
+    await cart_collection.update_one(
         {"user_id": user_id},
         {"$set": {"items": []}}
     )
@@ -345,12 +505,48 @@ async def clear_cart(user_id: str = Depends(get_current_user)):
 # ============ Order Routes ============
 
 @api_router.post("/orders")
-async def create_order(order_data: CreateOrder, user_id: str = Depends(get_current_user)):
+async def create_order(
+    order_data: CreateOrder,
+    user_id: str = Depends(get_current_user),
+    menu_loader: MenuItemLoader = Depends(MenuItemLoader)
+):
     # Get cart
-    cart = await db.cart.find_one({"user_id": user_id})
+    cart = await cart_collection.find_one({"user_id": user_id}, {"_id": 0, "items": 1})
     if not cart or not cart.get("items"):
         raise HTTPException(status_code=400, detail="Cart is empty")
     
+    # Fetch menu items joined with their restaurant in one round trip
+    by_id = await menu_loader.load_many(
+        [cart_item["menu_item_id"] for cart_item in cart["items"]], with_restaurant=True
+    )
+    
+    # The cart shows the prices snapshotted at add time. If any of them changed,
+    # or an item was taken off the menu, refresh the cart and make the user
+    # review it instead of charging a total they never saw
+    reconcile_ops = []
+    for cart_item in cart["items"]:
+        menu_item = by_id.get(cart_item["menu_item_id"])
+        if not menu_item:
+            reconcile_ops.append(UpdateOne(
+                {"user_id": user_id},
+                {"$pull": {"items": {"menu_item_id": cart_item["menu_item_id"]}}}
+            ))
+        elif cart_item.get("price", menu_item["price"]) != menu_item["price"]:
+            reconcile_ops.append(UpdateOne(
+                {"user_id": user_id, "items.menu_item_id": menu_item["id"]},
+                {"$set": {
+                    "items.$.name": menu_item["name"],
+                    "items.$.price": menu_item["price"],
+                    "items.$.image": menu_item["image"]
+                }}
+            ))
+    if reconcile_ops:
+        await cart_collection.bulk_write(reconcile_ops, ordered=False)
+        raise HTTPException(
+            status_code=409,
+            detail="Some items in your cart have changed. Please review your cart before placing the order."
+        )
+    
     # Calculate total and prepare order items
     order_items = []
     total_amount = 0
@@ -358,20 +554,18 @@ async def create_order(order_data: CreateOrder, user_id: str = Depends(get_curre
     restaurant_name = None
     
     for cart_item in cart["items"]:
-        menu_item = await db.menu_items.find_one({"id": cart_item["menu_item_id"]}, {"_id": 0})
-        if menu_item:
-            order_items.append({
-                "menu_item_id": menu_item["id"],
-                "name": menu_item["name"],
-                "price": menu_item["price"],
-                "quantity": cart_item["quantity"]
-            })
-            total_amount += menu_item["price"] * cart_item["quantity"]
-            
-            if not restaurant_id:
-                restaurant_id = menu_item["restaurant_id"]
-                restaurant = await db.restaurants.find_one({"id": restaurant_id}, {"_id": 0})
-                restaurant_name = restaurant["name"] if restaurant else "Unknown"
+        menu_item = by_id[cart_item["menu_item_id"]]
+        order_items.append({
+            "menu_item_id": menu_item["id"],
+            "name": menu_item["name"],
+            "price": menu_item["price"],
+            "quantity": cart_item["quantity"]
+        })
+        total_amount += menu_item["price"] * cart_item["quantity"]
+        
+        if not restaurant_id:
+            restaurant_id = menu_item["restaurant_id"]
+            restaurant_name = menu_item.get("restaurant_name", "Unknown")
     
     # Create order
     order_id = str(uuid.uuid4())
@@ -390,20 +584,34 @@ async def create_order(order_data: CreateOrder, user_id: str = Depends(get_curre
     await db.orders.insert_one(order_doc)
     
     # Clear cart
-    await db.cart.update_one(
+    await cart_collection.update_one(
         {"user_id": user_id},
         {"$set": {"items": []}}
     )
     
     return {"order_id": order_id, "message": "Order placed successfully"}
 
-@api_router.get("/orders", response_model=List[Order])
-async def get_orders(user_id: str = Depends(get_current_user)):
-    orders = await db.orders.find({"user_id": user_id}, {"_id": 0}).sort("created_at", -1).to_list(1000)
-    return orders
+@api_router.get("/orders", responses={200: {"model": OrderPage}})
+async def get_orders(
+    limit: int = Query(20, ge=1, le=50),
+    before: Optional[str] = None,
+    user_id: str = Depends(get_current_user)
+):
+    # Keyset pagination on created_at keeps the (user_id, created_at) index in play
+    query = {"user_id": user_id}
+    if before:
+        query["created_at"] = {"$lt": before}
+    
+    # Fetch one extra row to tell whether an older page exists
+    orders = await db.orders.find(query, {"_id": 0}).sort("created_at", -1).limit(limit + 1).to_list(limit + 1)
+    next_before = orders[limit - 1]["created_at"] if len(orders) > limit else None
+    return ORJSONResponse({"items": orders[:limit], "next_before": next_before})
 
 @api_router.get("/orders/{order_id}", response_model=Order)
-async def get_order(order_id: str, user_id: str = Depends(get_current_user)):
+async def get_order(
+    order_id: str = PathParam(..., min_length=1, max_length=ID_MAX_LENGTH, pattern=ID_PATTERN),
+    user_id: str = Depends(get_current_user)
+):
     order = await db.orders.find_one({"id": order_id, "user_id": user_id}, {"_id": 0})
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
@@ -413,11 +621,6 @@ async def get_order(order_id: str, user_id: str = Depends(get_current_user)):
 
 @api_router.post("/seed-data")
 async def seed_data():
-    # Check if data already exists
-    restaurant_count = await db.restaurants.count_documents({})
-    if restaurant_count > 0:
-        return {"message": "Data already seeded"}
-    
     # Sample restaurants
     restaurants = [
         {
@@ -516,8 +719,16 @@ async def seed_data():
         {"id": "menu19", "restaurant_id": "rest6", "name": "Spring Rolls", "description": "Fresh vegetable spring rolls", "price": 6.99, "image": "https://images.unsplash.com/photo-1594756202469-9ff9799dd03b?w=400&h=300&fit=crop", "category": "Appetizers", "available": True}
     ]
     
-    await db.restaurants.insert_many(restaurants)
-    await db.menu_items.insert_many(menu_items)
+    # Upsert by id so reruns (including after a partial failure) are no-ops
+    await db.restaurants.bulk_write(
+        [UpdateOne({"id": r["id"]}, {"$setOnInsert": r}, upsert=True) for r in restaurants],
+        ordered=False
+    )
+    await db.menu_items.bulk_write(
+        [UpdateOne({"id": m["id"]}, {"$setOnInsert": m}, upsert=True) for m in menu_items],
+        ordered=False
+    )
+    restaurants_cache.clear()
     
     return {"message": "Data seeded successfully"}
 
@@ -532,12 +743,60 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Skip access logs for high-volume public reads; auth, cart and order
+# requests stay logged for auditing
+QUIET_ACCESS_LOG_PREFIXES = ("/api/restaurants",)
+
+class QuietAccessLogFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        # uvicorn.access records carry (client, method, path, http_version, status)
+        if isinstance(record.args, tuple) and len(record.args) >= 3:
+            return not str(record.args[2]).startswith(QUIET_ACCESS_LOG_PREFIXES)
+        return True
+
+logging.getLogger("uvicorn.access").addFilter(QuietAccessLogFilter())
+
+@app.on_event("startup")
+async def warm_db_client():
+    # Force the handshake so the first request doesn't pay for it
+    await db.command("ping")
+
+async def create_unique_index(collection, field: str):
+    # Older releases checked for duplicates with a racy find-then-insert, so an
+    # existing database may already hold duplicates (e.g. two users with one
+    # email, two carts for one user). Don't refuse to start over it: log what
+    # needs merging. Until the index exists, the route guards that rely on it
+    # (duplicate signups, concurrent cart creation) are best-effort only.
+    try:
+        await collection.create_index(field, unique=True)
+    except OperationFailure as e:
+        logger.error(
+            "Could not create unique index on %s.%s: %s. Merge or remove the "
+            "duplicate documents, then restart to build the index.",
+            collection.name, field, e
+        )
+
+@app.on_event("startup")
+async def create_indexes():
+    await create_unique_index(db.users, "email")
+    await create_unique_index(db.users, "id")
+    await create_unique_index(db.restaurants, "id")
+    await db.restaurants.create_index("cuisine_type")
+    await db.restaurants.create_index([("name", "text"), ("description", "text")])
+    await create_unique_index(db.menu_items, "id")
+    await db.menu_items.create_index([("restaurant_id", 1), ("category", 1)])
+    await create_unique_index(cart_collection, "user_id")
+    await create_unique_index(db.orders, "id")
+    await db.orders.create_index([("user_id", 1), ("created_at", -1)])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
@@ -84,6 +84,10 @@ export default function CartPage({ user, setUser }) {
       navigate("/orders");
     } catch (error) {
       toast.error(error.response?.data?.detail || "Failed to place order");
+      if (error.response?.status === 409) {
+        // Prices or availability changed; show the refreshed cart
+        await loadCart();
+      }
     } finally {
       setPlacing(false);
     }
@@ -14,6 +14,7 @@ import { toast } from "sonner";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+const RESTAURANTS_PAGE_SIZE = 50;
 
 export default function HomePage({ user, setUser }) {
   const navigate = useNavigate();
@@ -39,8 +40,16 @@ export default function HomePage({ user, setUser }) {
 
   const loadRestaurants = async () => {
     try {
-      const response = await axios.get(`${API}/restaurants`);
-      setRestaurants(response.data);
+      // Search and cuisine filters run client-side, so page through the full list
+      const allRestaurants = [];
+      for (let offset = 0; ; offset += RESTAURANTS_PAGE_SIZE) {
+        const response = await axios.get(`${API}/restaurants`, {
+          params: { limit: RESTAURANTS_PAGE_SIZE, offset }
+        });
+        allRestaurants.push(...response.data);
+        if (response.data.length < RESTAURANTS_PAGE_SIZE) break;
+      }
+      setRestaurants(allRestaurants);
     } catch (error) {
       console.error("Error loading restaurants:", error);
     }
@@ -11,6 +11,8 @@ export default function OrdersPage({ user, setUser }) {
   const navigate = useNavigate();
   const [orders, setOrders] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextBefore, setNextBefore] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (!user) {
@@ -24,7 +26,8 @@ export default function OrdersPage({ user, setUser }) {
   const loadOrders = async () => {
     try {
       const response = await api.get("/orders");
-      setOrders(response.data);
+      setOrders(response.data.items);
+      setNextBefore(response.data.next_before);
     } catch (error) {
       console.error("Error loading orders:", error);
       toast.error("Failed to load orders");
@@ -33,6 +36,20 @@ export default function OrdersPage({ user, setUser }) {
     }
   };
 
+  const loadMoreOrders = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await api.get("/orders", { params: { before: nextBefore } });
+      setOrders((prev) => [...prev, ...response.data.items]);
+      setNextBefore(response.data.next_before);
+    } catch (error) {
+      console.error("Error loading orders:", error);
+      toast.error("Failed to load more orders");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const getStatusIcon = (status) => {
     switch (status) {
       case "placed":
@@ -174,6 +191,20 @@ export default function OrdersPage({ user, setUser }) {
                 </div>
               </Card>
             ))}
+
+            {nextBefore && (
+              <div className="text-center">
+                <Button
+                  data-testid="load-more-orders-button"
+                  onClick={loadMoreOrders}
+                  disabled={loadingMore}
+                  variant="outline"
+                  className="rounded-full px-8 border-orange-300 text-orange-600 hover:bg-orange-50"
+                >
+                  {loadingMore ? "Loading..." : "Load more orders"}
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </div>
@@ -10,6 +10,19 @@ import { toast } from "sonner";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+const MENU_PAGE_SIZE = 50;
+
+const loadFullMenu = async (restaurantId) => {
+  // Category filters run client-side, so page through the whole menu
+  const items = [];
+  for (let offset = 0; ; offset += MENU_PAGE_SIZE) {
+    const response = await axios.get(`${API}/restaurants/${restaurantId}/menu`, {
+      params: { limit: MENU_PAGE_SIZE, offset }
+    });
+    items.push(...response.data);
+    if (response.data.length < MENU_PAGE_SIZE) return items;
+  }
+};
 
 export default function RestaurantPage({ user, setUser }) {
   const { id } = useParams();
@@ -26,12 +39,12 @@ export default function RestaurantPage({ user, setUser }) {
 
   const loadRestaurantData = async () => {
     try {
-      const [restaurantRes, menuRes] = await Promise.all([
+      const [restaurantRes, menu] = await Promise.all([
         axios.get(`${API}/restaurants/${id}`),
-        axios.get(`${API}/restaurants/${id}/menu`)
+        loadFullMenu(id)
       ]);
       setRestaurant(restaurantRes.data);
-      setMenuItems(menuRes.data);
+      setMenuItems(menu);
     } catch (error) {
       console.error("Error loading restaurant data:", error);
       toast.error("Failed to load restaurant");
@@ -52,8 +65,7 @@ export default function RestaurantPage({ user, setUser }) {
     try {
       await api.post("/cart/add", {
         menu_item_id: menuItem.id,
-        quantity: quantity,
-        restaurant_id: restaurant.id
+        quantity: quantity
       });
       toast.success(`Added ${menuItem.name} to cart`);
       setQuantities({ ...quantities, [menuItem.id]: 1 });